@@ -8,3 +8,5 @@ The core classes for agent creation and management are found in agent_base.py an
 from .agent_base import AIAgent
 from .agent_manager import AgentManager
 from .agent_config import AgentConfig
+
+__all__ = ["AIAgent", "AgentManager", "AgentConfig"]
@@ -1,26 +1,48 @@
 # agent_base.py
+import atexit
+import heapq
 import logging
+import queue
 import time
 import random
-from datetime import datetime
-from threading import Thread, Lock
-from typing import Dict, List, Any, Optional
-from agent_config import AgentConfig
+from collections import deque
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
+from typing import Deque, Dict, List, Any, Optional, Tuple
+from .agent_config import AgentConfig
+
+# Agent threads only enqueue log records; a single listener thread writes them out
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'  # explicit datefmt skips the per-record msec formatting
+))
+_log_listener = QueueListener(_log_queue, _log_handler, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logger = logging.getLogger("AgentBase")
+logger.setLevel(logging.DEBUG)
+if not logger.handlers:  # module reloads must not stack handlers
+    logger.addHandler(QueueHandler(_log_queue))
 
 class AgentBase:
+    __slots__ = (
+        "logger", "config", "agent_name", "platform", "environment", "task_interval",
+        "max_concurrent_tasks", "history_size", "max_retries", "retry_interval",
+        "exponential_backoff", "retry_count", "running", "tasks", "active_tasks",
+        "task_history", "_task_lock", "_expire_heap", "_pool", "_completed_count",
+        "_failed_count", "_total_task_time", "_start_time"
+    )
+
     def __init__(self, config_file: Optional[str] = None):
         """
         Initialize the agent base with configuration, logging, and task handling.
         :param config_file: Path to the configuration file (optional).
         """
-        # Setup logging with a better format
-        self.logger = logging.getLogger("AgentBase")
-        self.logger.setLevel(logging.DEBUG)
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        if not self.logger.handlers:
-            handler = logging.StreamHandler()
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
+        self.logger = logger
         
         # Setup the configuration
         self.config = AgentConfig(config_file)
@@ -30,60 +52,95 @@ class AgentBase:
         
         # Task management
         self._task_lock = Lock()
-        self.tasks: List[Dict[str, Any]] = []
-        self.active_tasks: Dict[str, datetime] = {}
-        self.task_history: List[Dict[str, Any]] = []
+        self.tasks: Dict[str, Any] = {}  # task_name -> task_details
+        self.active_tasks: Dict[str, float] = {}  # task_name -> monotonic start time
+        self._expire_heap: List[Tuple[float, str]] = []  # (start time, task_name), oldest first
+        self.task_history: Deque[Dict[str, Any]] = deque(maxlen=self.history_size)
+        self._pool: Optional[ThreadPoolExecutor] = None  # Created on first use, shut down when start() exits
         
-        # Performance metrics
-        self.metrics = {
-            'total_tasks_completed': 0,
-            'failed_tasks': 0,
-            'average_task_time': 0
-        }
+        # Performance metrics (average task time is derived in get_metrics)
+        self._completed_count = 0
+        self._failed_count = 0
+        self._total_task_time = 0.0
         
-        self.logger.info(f"Initializing {self.agent_name} on {self.platform} in {self.environment} environment.")
+        self.logger.info("Initializing %s on %s in %s environment.", self.agent_name, self.platform, self.environment)
 
     def _load_config(self) -> None:
         """Load configuration settings from config file"""
         config = self.config.get_config()
+        scheduler_config = config.get("task_scheduler") or {}
         self.agent_name = config.get("agent_name", "DefaultAgent")
         self.platform = config.get("platform", "Generic")
         self.environment = config.get("environment", "production")
-        self.task_interval = config.get("task_scheduler", {}).get("interval", 30)
-        self.retry_policy = config.get("retry_policy", {
+        self.task_interval = scheduler_config.get("interval", 30)
+        self.max_concurrent_tasks = scheduler_config.get("max_concurrent_tasks", 5)
+        self.history_size = config.get("history_size", 10000)
+        retry_policy = config.get("retry_policy") or {
             "max_retries": 3,
             "retry_interval": 5,
             "exponential_backoff": True
-        })
+        }
+        self.max_retries = retry_policy["max_retries"]
+        self.retry_interval = retry_policy["retry_interval"]
+        self.exponential_backoff = retry_policy.get("exponential_backoff", False)
         self.retry_count = 0
         self.running = False
 
     def start(self) -> None:
         """Start the agent with improved error handling and monitoring"""
         self.running = True
-        self.start_periodic_logging()
-        self.logger.info(f"{self.agent_name} is now running.")
+        self.logger.info("%s is now running.", self.agent_name)
+        next_tick = time.monotonic()
+        next_status_log = next_tick + 60  # Log status every minute.
         
-        while self.running:
-            try:
-                self.run_tasks()
-                self._cleanup_completed_tasks()
-                time.sleep(self.task_interval)
-            except Exception as e:
-                self.logger.error(f"Error while running tasks: {str(e)}", exc_info=True)
-                if not self._handle_retry():
-                    break
+        try:
+            while self.running:
+                try:
+                    self.run_tasks()
+                    self._cleanup_completed_tasks()
+                    if time.monotonic() >= next_status_log:
+                        self.log_status()
+                        next_status_log = time.monotonic() + 60
+                    
+                    # Sleep until the next deadline so task time doesn't add drift
+                    next_tick += self.task_interval
+                    sleep_for = next_tick - time.monotonic()
+                    if sleep_for > 0:
+                        time.sleep(sleep_for)
+                    else:
+                        self.logger.warning("Tick overran by %.2fs", -sleep_for)
+                        next_tick = time.monotonic()
+                except Exception as e:
+                    self.logger.error("Error while running tasks: %s", e, exc_info=True)
+                    if not self._handle_retry():
+                        self.logger.error("Max retry attempts reached. Stopping agent.")
+                        self.stop()
+        finally:
+            # Release the worker threads; the next start() creates a fresh pool
+            pool, self._pool = self._pool, None
+            if pool is not None:
+                pool.shutdown(wait=False)
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Return the agent's thread pool, creating it if the agent has none yet"""
+        pool = self._pool
+        if pool is None:
+            pool = self._pool = ThreadPoolExecutor(
+                max_workers=self.max_concurrent_tasks,
+                thread_name_prefix=self.agent_name
+            )
+        return pool
 
     def _handle_retry(self) -> bool:
         """Handle retry logic with exponential backoff"""
-        if self.retry_count < self.retry_policy["max_retries"]:
+        if self.retry_count < self.max_retries:
             self.retry_count += 1
-            retry_interval = self.retry_policy["retry_interval"]
-            if self.retry_policy.get("exponential_backoff"):
+            retry_interval = self.retry_interval
+            if self.exponential_backoff:
                 retry_interval *= (2 ** (self.retry_count - 1))
             
-            self.logger.info(f"Retrying in {retry_interval} seconds... "
-                           f"Attempt {self.retry_count}/{self.retry_policy['max_retries']}")
+            self.logger.info("Retrying in %s seconds... Attempt %d/%d",
+                             retry_interval, self.retry_count, self.max_retries)
             time.sleep(retry_interval)
             return True
         return False
@@ -92,92 +149,93 @@ class AgentBase:
         """
         Execute a specific task with improved monitoring and metrics.
         """
-        start_time = time.time()
-        self.active_tasks[task_name] = datetime.now()
+        start_time = time.monotonic()
+        with self._task_lock:
+            self.active_tasks[task_name] = start_time
+            heapq.heappush(self._expire_heap, (start_time, task_name))
         
         try:
-            self.logger.info(f"Executing task: {task_name}")
-            # Add your actual task execution logic here
-            time.sleep(random.randint(1, 5))
+            self.logger.info("Executing task: %s", task_name)
+            self._task_runner(task_name, task_details)
             
             # Update metrics
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             with self._task_lock:
-                self.metrics['total_tasks_completed'] += 1
-                self.metrics['average_task_time'] = (
-                    (self.metrics['average_task_time'] * (self.metrics['total_tasks_completed'] - 1) +
-                     execution_time) / self.metrics['total_tasks_completed']
-                )
+                self._completed_count += 1
+                self._total_task_time += execution_time
             
             # Record task history
             self.task_history.append({
                 'task_name': task_name,
                 'status': 'completed',
                 'execution_time': execution_time,
-                'timestamp': datetime.now()
+                'timestamp': time.time()  # epoch seconds
             })
             
         except Exception as e:
-            self.logger.error(f"Task execution failed: {task_name}", exc_info=True)
+            self.logger.error("Task execution failed: %s", task_name, exc_info=True)
             with self._task_lock:
-                self.metrics['failed_tasks'] += 1
+                self._failed_count += 1
             self.task_history.append({
                 'task_name': task_name,
                 'status': 'failed',
                 'error': str(e),
-                'timestamp': datetime.now()
+                'timestamp': time.time()  # epoch seconds
             })
             raise
         finally:
-            self.active_tasks.pop(task_name, None)
+            # Under the lock so _cleanup_completed_tasks can't see the entry vanish mid-check
+            with self._task_lock:
+                self.active_tasks.pop(task_name, None)
+
+    def _task_runner(self, task_name: str, task_details: Dict[str, Any]) -> None:
+        """
+        Run the actual work for a task. Override in subclasses; the base
+        implementation only simulates work in the development environment.
+        """
+        if self.environment == "development":
+            time.sleep(random.randint(1, 5))
 
     def _cleanup_completed_tasks(self) -> None:
-        """Remove completed tasks that are older than the specified threshold"""
-        current_time = datetime.now()
-        stale_tasks = [
-            task_name for task_name, start_time in self.active_tasks.items()
-            if (current_time - start_time).total_seconds() > 3600  # 1 hour timeout
-        ]
+        """Remove active tasks that are older than the specified threshold"""
+        cutoff = time.monotonic() - 3600  # 1 hour timeout
+        stale_tasks = []
+        
+        with self._task_lock:
+            heap = self._expire_heap
+            while heap and heap[0][0] < cutoff:
+                start_time, task_name = heapq.heappop(heap)
+                # Entries for tasks that already finished or restarted are skipped
+                if self.active_tasks.get(task_name) == start_time:
+                    del self.active_tasks[task_name]
+                    stale_tasks.append(task_name)
+            
+            # Drop entries for finished tasks once they dominate the heap
+            if len(heap) > 2 * len(self.active_tasks) + 64:
+                heap[:] = [(start_time, task_name) for task_name, start_time in self.active_tasks.items()]
+                heapq.heapify(heap)
         
         for task_name in stale_tasks:
-            self.logger.warning(f"Task {task_name} timed out and will be terminated")
-            self.active_tasks.pop(task_name, None)
+            self.logger.warning("Task %s timed out and will be terminated", task_name)
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get current performance metrics"""
+        completed = self._completed_count
         return {
-            **self.metrics,
+            'total_tasks_completed': completed,
+            'failed_tasks': self._failed_count,
+            'average_task_time': self._total_task_time / completed if completed else 0,
             'active_tasks': len(self.active_tasks),
             'total_tasks': len(self.tasks),
             'uptime': time.time() - self._start_time if hasattr(self, '_start_time') else 0
         }
 
-    def start(self):
-        """
-        Start the agent, running the tasks periodically.
-        """
-        self.running = True
-        self.logger.info(f"{self.agent_name} is now running.")
-        while self.running:
-            try:
-                self.run_tasks()
-                time.sleep(self.task_interval)
-            except Exception as e:
-                self.logger.error(f"Error while running tasks: {str(e)}")
-                if self.retry_count < self.retry_policy.get("max_retries", 3):
-                    self.retry_count += 1
-                    self.logger.info(f"Retrying... Attempt {self.retry_count}/{self.retry_policy['max_retries']}")
-                    time.sleep(self.retry_policy.get("retry_interval", 5))
-                else:
-                    self.logger.error(f"Max retry attempts reached. Stopping agent.")
-                    self.stop()
-    
     def stop(self):
         """
         Stop the agent and terminate all running tasks.
         """
         self.running = False
-        self.logger.info(f"{self.agent_name} has stopped.")
+        self.logger.info("%s has stopped.", self.agent_name)
     
     def add_task(self, task_name, task_details):
         """
@@ -185,34 +243,35 @@ class AgentBase:
         :param task_name: The name of the task.
         :param task_details: Details about the task (could be a function or a set of actions).
         """
-        task = {
-            "task_name": task_name,
-            "task_details": task_details
-        }
-        self.tasks.append(task)
-        self.logger.info(f"Task '{task_name}' added to the agent.")
+        self.tasks[task_name] = task_details
+        self.logger.info("Task '%s' added to the agent.", task_name)
     
     def remove_task(self, task_name):
         """
         Remove a task from the agent's task list by name.
         :param task_name: The name of the task to remove.
         """
-        self.tasks = [task for task in self.tasks if task["task_name"] != task_name]
-        self.logger.info(f"Task '{task_name}' removed from the agent.")
+        self.tasks.pop(task_name, None)
+        self.logger.info("Task '%s' removed from the agent.", task_name)
     
     def run_tasks(self):
         """
-        Run all tasks in the agent's task list. This will execute tasks and handle errors.
+        Run all tasks in the agent's task list concurrently on the agent's thread pool
+        and wait for every task to finish. Task errors are logged, not raised.
         """
         if not self.tasks:
-            self.logger.info(f"No tasks to execute for {self.agent_name}.")
+            self.logger.info("No tasks to execute for %s.", self.agent_name)
             return
         
-        for task in self.tasks:
-            try:
-                self.execute_task(task["task_name"], task["task_details"])
-            except Exception as e:
-                self.logger.error(f"Error executing task {task['task_name']}: {str(e)}")
+        pool = self._get_pool()
+        futures = {
+            pool.submit(self.execute_task, task_name, task_details): task_name
+            for task_name, task_details in list(self.tasks.items())
+        }
+        for future in as_completed(futures):
+            error = future.exception()
+            if error is not None:
+                self.logger.error("Error executing task %s: %s", futures[future], error)
     
     def get_status(self):
         """
@@ -231,34 +290,17 @@ class AgentBase:
         """
         Log the current status of the agent.
         """
-        status = self.get_status()
-        self.logger.info(f"Agent Status - Name: {status['agent_name']}, Platform: {status['platform']}, "
-                         f"Tasks in Progress: {status['tasks_in_progress']}, Retry Count: {status['retry_count']}, "
-                         f"Running: {status['running']}")
-    
-    def periodic_log(self):
-        """
-        Periodically log the agent's status.
-        """
-        while self.running:
-            self.log_status()
-            time.sleep(60)  # Log status every minute.
-    
-    def start_periodic_logging(self):
-        """
-        Start periodic logging in a separate thread to avoid blocking the main thread.
-        """
-        log_thread = Thread(target=self.periodic_log)
-        log_thread.daemon = True
-        log_thread.start()
-        self.logger.info("Started periodic logging thread.")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info("Agent Status - Name: %s, Platform: %s, Tasks in Progress: %d, Retry Count: %d, Running: %s",
+                         self.agent_name, self.platform, len(self.tasks), self.retry_count, self.running)
     
     def load_platform_config(self, platform_name):
         """
         Dynamically load configuration for the given platform.
         :param platform_name: Name of the platform.
         """
-        self.logger.info(f"Loading platform configuration for {platform_name}...")
+        self.logger.info("Loading platform configuration for %s...", platform_name)
         # This is where you would load platform-specific configurations, 
         # like API keys, custom task logic, etc.
         # You could extend this with actual logic to load platform configurations.
@@ -271,3 +313,6 @@ class AgentBase:
         self.config.update_config(new_config)
         self.logger.info("Configuration updated.")
 
+
+# Public name used by the package and AgentManager
+AIAgent = AgentBase
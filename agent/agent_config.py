@@ -1,10 +1,99 @@
 # agent_config.py
+import copy
 import json
 import os
 import logging
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, Mapping, Optional
 from pathlib import Path
-from datetime import datetime
+from types import MappingProxyType
+from utils.json_utils import json_dumps, json_loads
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; large files are then parsed in one pass
+    ijson = None
+
+# Config files larger than this are streamed with ijson (when installed)
+_STREAM_THRESHOLD = 1024 * 1024  # 1MB
+
+logger = logging.getLogger("AgentConfig")
+logger.setLevel(logging.DEBUG)
+if not logger.handlers:  # module reloads must not stack handlers
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    logger.addHandler(_handler)
+
+
+def _merge_into(target: Dict[str, Any], source: Dict[str, Any]) -> None:
+    """Merge source into target in place, descending into nested dicts present in both."""
+    for key, value in source.items():
+        existing = target.get(key)
+        if isinstance(existing, dict) and isinstance(value, dict):
+            _merge_into(existing, value)
+        else:
+            target[key] = value
+
+
+def _add_task_entry(tasks: Dict[str, Any], entry: Any) -> None:
+    """Fold one {"task_name", "task_details"} entry into a task_name -> task_details dict."""
+    task_name = entry.get("task_name") if isinstance(entry, dict) else None
+    if task_name is None:
+        logger.warning("Skipping task entry without a task_name: %r", entry)
+        return
+    if task_name in tasks:
+        logger.warning("Duplicate task '%s' in config; keeping the last definition.", task_name)
+    tasks[task_name] = entry.get("task_details")
+
+
+def _stream_config(file) -> Dict[str, Any]:
+    """
+    Build a config dict from a JSON stream without reading the whole file into memory.
+    Entries of the top-level "tasks" array are folded into a task_name -> task_details
+    dict one at a time, so the task list itself is never materialized.
+    """
+    config: Dict[str, Any] = {}
+    key = None
+    builder = None
+    streaming_tasks = False
+    depth = 0
+    
+    for _, event, value in ijson.parse(file, use_float=True):
+        if depth == 1 and event == 'map_key':
+            key = value
+        elif depth == 1 and event == 'end_map':
+            pass
+        elif depth == 1 and key == 'tasks' and event == 'start_array':
+            config['tasks'] = {}
+            streaming_tasks = True
+        elif streaming_tasks and depth == 2 and event == 'end_array':
+            streaming_tasks = False
+        elif depth >= 1:
+            if builder is None:
+                builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+        
+        if event in ('start_map', 'start_array'):
+            depth += 1
+        elif event in ('end_map', 'end_array'):
+            depth -= 1
+        
+        # A value is complete once we're back at the depth it started from
+        if builder is not None and depth == (2 if streaming_tasks else 1):
+            if streaming_tasks:
+                _add_task_entry(config['tasks'], builder.value)
+            else:
+                config[key] = builder.value
+            builder = None
+    
+    return config
+
+
+def _load_platform_file(path: str) -> Dict[str, Any]:
+    """Parse a platform config file; a fresh dict each time, so it can be merged without copying."""
+    with open(path, 'rb') as file:
+        return json_loads(file.read())
+
 
 class AgentConfig:
     def __init__(self, config_file: Optional[str] = None):
@@ -13,31 +102,21 @@ class AgentConfig:
         :param config_file: Optional path to a JSON configuration file.
         """
         self.config: Dict[str, Any] = {}
-        self._setup_logging()
+        self._view: Mapping[str, Any] = MappingProxyType(self.config)
+        self.logger = logger
         self._config_file = config_file
-        self._last_modified: Optional[datetime] = None
+        self._last_mtime_ns: Optional[int] = None
         
         if config_file:
             self.load_config(config_file)
         else:
             self.set_default_config()
 
-    def _setup_logging(self) -> None:
-        """Setup logging with proper formatting"""
-        self.logger = logging.getLogger("AgentConfig")
-        self.logger.setLevel(logging.DEBUG)
-        
-        if not self.logger.handlers:
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler = logging.StreamHandler()
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
-
     def set_default_config(self) -> None:
         """Set the default configuration for the agent."""
-        self.config = {
+        # Reset in place so views returned by get_config() stay live across reloads
+        self.config.clear()
+        self.config.update({
             "agent_name": "DefaultAgent",
             "platform": "Generic",
             "api_keys": {},
@@ -47,7 +126,7 @@ class AgentConfig:
                 "max_concurrent_tasks": 5,
                 "task_timeout": 3600  # 1 hour
             },
-            "tasks": [],
+            "tasks": {},  # task_name -> task_details; stored as a list on disk
             "logging": {
                 "level": "DEBUG",
                 "file": "agent_log.txt",
@@ -71,7 +150,7 @@ class AgentConfig:
                 "key_rotation_interval": 86400,  # 24 hours
                 "allowed_ips": []
             }
-        }
+        })
 
     def load_config(self, config_file: str) -> None:
         """
@@ -79,41 +158,49 @@ class AgentConfig:
         :param config_file: Path to the JSON configuration file.
         """
         config_path = Path(config_file)
-        if not config_path.exists():
-            raise FileNotFoundError(f"Configuration file {config_file} not found.")
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file {config_file} not found.") from None
         
         try:
-            with config_path.open('r') as file:
-                new_config = json.load(file)
+            # Re-parsing is cheaper than copying a cached parse, so every load reads the file
+            with config_path.open('rb') as file:
+                if ijson is not None and stat.st_size > _STREAM_THRESHOLD:
+                    new_config = _stream_config(file)
+                else:
+                    new_config = json_loads(file.read())
             
             # Validate and merge with defaults
             self.set_default_config()
             self._merge_configs(new_config)
+            self._normalize_tasks()
             
-            self._last_modified = datetime.fromtimestamp(config_path.stat().st_mtime)
-            self.logger.info(f"Configuration loaded from {config_file}")
+            self._last_mtime_ns = stat.st_mtime_ns
+            self.logger.info("Configuration loaded from %s", config_file)
             
         except json.JSONDecodeError as e:
-            self.logger.error(f"Invalid JSON in config file: {e}")
+            self.logger.error("Invalid JSON in config file: %s", e)
             raise
         except Exception as e:
-            self.logger.error(f"Error loading config: {e}")
+            self.logger.error("Error loading config: %s", e)
             raise
 
     def _merge_configs(self, new_config: Dict[str, Any]) -> None:
         """
-        Recursively merge new configuration with existing config.
+        Recursively merge new configuration into the existing config in place.
         :param new_config: New configuration to merge.
         """
-        for key, value in new_config.items():
-            if (
-                key in self.config 
-                and isinstance(self.config[key], dict) 
-                and isinstance(value, dict)
-            ):
-                self._merge_configs(value)
-            else:
-                self.config[key] = value
+        _merge_into(self.config, new_config)
+
+    def _normalize_tasks(self) -> None:
+        """Convert a list of {"task_name", "task_details"} entries into a dict keyed by task name."""
+        tasks = self.config.get("tasks")
+        if isinstance(tasks, list):
+            normalized: Dict[str, Any] = {}
+            for entry in tasks:
+                _add_task_entry(normalized, entry)
+            self.config["tasks"] = normalized
 
     def save_config(self, config_file: Optional[str] = None) -> None:
         """
@@ -123,19 +210,26 @@ class AgentConfig:
         save_path = Path(config_file or self._config_file)
         
         # Create backup of existing config
+        backup_path = None
         if save_path.exists():
-            backup_path = save_path.with_suffix(f'.backup_{datetime.now():%Y%m%d_%H%M%S}')
+            backup_path = save_path.with_suffix(f'.backup_{time.time_ns()}')
             save_path.rename(backup_path)
-            self.logger.info(f"Created backup at {backup_path}")
+            self.logger.info("Created backup at %s", backup_path)
         
         try:
-            with save_path.open('w') as file:
-                json.dump(self.config, file, indent=4)
-            self.logger.info(f"Configuration saved to {save_path}")
+            # Tasks are kept keyed by name in memory but saved in the list form
+            data = dict(self.config)
+            data["tasks"] = [
+                {"task_name": task_name, "task_details": task_details}
+                for task_name, task_details in self.config.get("tasks", {}).items()
+            ]
+            with save_path.open('wb') as file:
+                file.write(json_dumps(data))
+            self.logger.info("Configuration saved to %s", save_path)
             
         except Exception as e:
-            self.logger.error(f"Error saving config: {e}")
-            if backup_path.exists():
+            self.logger.error("Error saving config: %s", e)
+            if backup_path is not None and backup_path.exists():
                 backup_path.rename(save_path)
                 self.logger.info("Restored from backup after save failure")
             raise
@@ -147,17 +241,25 @@ class AgentConfig:
         :param save: Whether to save the updated config to file.
         """
         self._merge_configs(new_config)
+        self._normalize_tasks()
         self.logger.info("Configuration updated.")
         
         if save and self._config_file:
             self.save_config()
 
-    def get_config(self) -> Dict[str, Any]:
+    def get_config(self) -> Mapping[str, Any]:
         """
-        Get the current configuration as a dictionary.
+        Get a read-only view of the current configuration.
+        :return: Mapping that reflects the current configuration without copying it.
+        """
+        return self._view
+
+    def get_config_copy(self) -> Dict[str, Any]:
+        """
+        Get a deep copy of the current configuration for callers that need to modify it.
         :return: Dictionary representing the current configuration.
         """
-        return self.config.copy()  # Return a copy to prevent direct modification
+        return copy.deepcopy(self.config)
 
     def reload_if_modified(self) -> bool:
         """
@@ -167,12 +269,12 @@ class AgentConfig:
         if not self._config_file:
             return False
             
-        config_path = Path(self._config_file)
-        if not config_path.exists():
+        try:
+            mtime_ns = os.stat(self._config_file).st_mtime_ns
+        except FileNotFoundError:
             return False
             
-        last_modified = datetime.fromtimestamp(config_path.stat().st_mtime)
-        if self._last_modified and last_modified > self._last_modified:
+        if self._last_mtime_ns is not None and mtime_ns > self._last_mtime_ns:
             self.load_config(self._config_file)
             return True
         return False
@@ -194,7 +296,7 @@ class AgentConfig:
         if "api_keys" not in self.config:
             self.config["api_keys"] = {}
         self.config["api_keys"][platform_name] = api_key
-        self.logger.info(f"API key for {platform_name} set.")
+        self.logger.info("API key for %s set.", platform_name)
 
     def set_task_scheduler(self, interval, timezone="UTC"):
         """
@@ -206,7 +308,7 @@ class AgentConfig:
             "interval": interval,
             "timezone": timezone
         }
-        self.logger.info(f"Task scheduler set to {interval} seconds, timezone {timezone}.")
+        self.logger.info("Task scheduler set to %s seconds, timezone %s.", interval, timezone)
 
     def add_task(self, task_name, task_details):
         """
@@ -214,20 +316,16 @@ class AgentConfig:
         :param task_name: Name of the task.
         :param task_details: Details of the task (a dictionary).
         """
-        task = {
-            "task_name": task_name,
-            "task_details": task_details
-        }
-        self.config["tasks"].append(task)
-        self.logger.info(f"Task '{task_name}' added.")
+        self.config["tasks"][task_name] = task_details
+        self.logger.info("Task '%s' added.", task_name)
 
     def remove_task(self, task_name):
         """
         Remove a task by its name from the agent configuration.
         :param task_name: Name of the task to remove.
         """
-        self.config["tasks"] = [task for task in self.config["tasks"] if task["task_name"] != task_name]
-        self.logger.info(f"Task '{task_name}' removed.")
+        self.config["tasks"].pop(task_name, None)
+        self.logger.info("Task '%s' removed.", task_name)
 
     def set_environment(self, environment):
         """
@@ -235,7 +333,7 @@ class AgentConfig:
         :param environment: The environment to set.
         """
         self.config["environment"] = environment
-        self.logger.info(f"Environment set to {environment}.")
+        self.logger.info("Environment set to %s.", environment)
 
     def set_retry_policy(self, max_retries, retry_interval):
         """
@@ -247,7 +345,7 @@ class AgentConfig:
             "max_retries": max_retries,
             "retry_interval": retry_interval
         }
-        self.logger.info(f"Retry policy set: Max retries = {max_retries}, Retry interval = {retry_interval} seconds.")
+        self.logger.info("Retry policy set: Max retries = %s, Retry interval = %s seconds.", max_retries, retry_interval)
 
     def get_logging_config(self):
         """
@@ -274,11 +372,11 @@ class AgentConfig:
         :param platform_name: The platform for which to load configuration.
         """
         platform_config_path = f"platform_configs/{platform_name}_config.json"
-        if os.path.exists(platform_config_path):
-            with open(platform_config_path, 'r') as file:
-                platform_config = json.load(file)
-            self.update_config(platform_config)
-            self.logger.info(f"Loaded platform-specific configuration for {platform_name}.")
-        else:
-            self.logger.warning(f"No platform-specific configuration found for {platform_name}. Using default.")
+        try:
+            platform_config = _load_platform_file(platform_config_path)
+        except FileNotFoundError:
+            self.logger.warning("No platform-specific configuration found for %s. Using default.", platform_name)
+            return
+        self.update_config(platform_config, save=False)
+        self.logger.info("Loaded platform-specific configuration for %s.", platform_name)
 
@@ -1,16 +1,32 @@
 # agent_manager.py
-from agent_base import AIAgent
-from agent_config import AgentConfig
+from .agent_base import AIAgent
+from .agent_config import AgentConfig
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 
+_MISSING = object()
+
 class AgentManager:
-    def __init__(self):
+    def __init__(self, max_concurrent_tasks=5):
         """
         Initialize the AgentManager with an empty agent list and a logger.
+        :param max_concurrent_tasks: Maximum number of tasks run at once by execute_all_tasks.
         """
         self.agents = {}  # Dictionary to hold agents by name
         self.logger = logging.getLogger("AgentManager")
         self.logger.setLevel(logging.DEBUG)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_tasks,
+            thread_name_prefix="AgentManager"
+        )
+
+    def close(self):
+        """
+        Shut down the thread pool used by execute_all_tasks.
+        Tasks already running finish; no new tasks can be executed afterwards.
+        """
+        self._executor.shutdown(wait=False)
+        self.logger.info("AgentManager closed.")
 
     def create_agent(self, name, config_file=None):
         """
@@ -19,18 +35,17 @@ class AgentManager:
         :param config_file: Optional configuration file path for agent settings.
         :return: A new instance of AIAgent.
         """
-        if name in self.agents:
-            self.logger.warning(f"Agent with name {name} already exists. Using existing agent.")
-            return self.agents[name]
+        existing = self.agents.get(name)
+        if existing is not None:
+            self.logger.warning("Agent with name %s already exists. Using existing agent.", name)
+            return existing
 
-        # Load agent configuration
-        agent_config = AgentConfig(config_file) if config_file else AgentConfig()
-
-        # Create a new agent
-        agent = AIAgent(name, agent_config.get_config())
+        # The agent loads its own configuration from the file; the registry name wins over the file's
+        agent = AIAgent(config_file)
+        agent.agent_name = name
         self.agents[name] = agent
 
-        self.logger.info(f"Agent '{name}' created successfully.")
+        self.logger.info("Agent '%s' created successfully.", name)
         return agent
 
     def remove_agent(self, name):
@@ -39,12 +54,11 @@ class AgentManager:
         :param name: Name of the agent to remove.
         :return: True if agent is removed, False if not found.
         """
-        if name in self.agents:
-            del self.agents[name]
-            self.logger.info(f"Agent '{name}' removed successfully.")
+        if self.agents.pop(name, None) is not None:
+            self.logger.info("Agent '%s' removed successfully.", name)
             return True
         else:
-            self.logger.warning(f"Agent '{name}' not found. Unable to remove.")
+            self.logger.warning("Agent '%s' not found. Unable to remove.", name)
             return False
 
     def list_agents(self):
@@ -53,7 +67,7 @@ class AgentManager:
         :return: List of agent names.
         """
         agent_names = list(self.agents.keys())
-        self.logger.info(f"Listing {len(agent_names)} agents: {agent_names}")
+        self.logger.info("Listing %d agents: %s", len(agent_names), agent_names)
         return agent_names
 
     def get_agent(self, name):
@@ -63,10 +77,10 @@ class AgentManager:
         :return: AIAgent object if found, None if not.
         """
         agent = self.agents.get(name)
-        if agent:
-            self.logger.info(f"Agent '{name}' retrieved successfully.")
+        if agent is not None:
+            self.logger.info("Agent '%s' retrieved successfully.", name)
         else:
-            self.logger.warning(f"Agent '{name}' not found.")
+            self.logger.warning("Agent '%s' not found.", name)
         return agent
 
     def update_agent(self, name, config_file):
@@ -80,10 +94,10 @@ class AgentManager:
         if agent:
             agent_config = AgentConfig(config_file)
             agent.config = agent_config.get_config()  # Update the agent's config
-            self.logger.info(f"Agent '{name}' updated successfully.")
+            self.logger.info("Agent '%s' updated successfully.", name)
             return True
         else:
-            self.logger.warning(f"Agent '{name}' not found. Unable to update.")
+            self.logger.warning("Agent '%s' not found. Unable to update.", name)
             return False
 
     def execute_agent_task(self, name, task_name):
@@ -95,24 +109,32 @@ class AgentManager:
         """
         agent = self.get_agent(name)
         if agent:
-            task = next((t for t in agent.tasks if t.name == task_name), None)
-            if task:
-                task.run()
-                self.logger.info(f"Executed task '{task_name}' for agent '{name}'.")
+            task_details = agent.tasks.get(task_name, _MISSING)
+            if task_details is not _MISSING:
+                agent.execute_task(task_name, task_details)
+                self.logger.info("Executed task '%s' for agent '%s'.", task_name, name)
             else:
-                self.logger.warning(f"Task '{task_name}' not found for agent '{name}'.")
+                self.logger.warning("Task '%s' not found for agent '%s'.", task_name, name)
         else:
-            self.logger.warning(f"Agent '{name}' not found. Task execution failed.")
+            self.logger.warning("Agent '%s' not found. Task execution failed.", name)
 
     def execute_all_tasks(self):
         """
-        Execute all tasks for all agents.
+        Execute all tasks for all agents concurrently and wait for them to finish.
         :return: None
         """
-        for agent in self.agents.values():
-            for task in agent.tasks:
-                task.run()
-                self.logger.info(f"Executed task '{task.name}' for agent '{agent.name}'.")
+        futures = {
+            self._executor.submit(agent.execute_task, task_name, task_details): (name, task_name)
+            for name, agent in list(self.agents.items())
+            for task_name, task_details in list(agent.tasks.items())
+        }
+        for future in as_completed(futures):
+            name, task_name = futures[future]
+            error = future.exception()
+            if error is not None:
+                self.logger.error("Task '%s' failed for agent '%s': %s", task_name, name, error)
+            else:
+                self.logger.info("Executed task '%s' for agent '%s'.", task_name, name)
 
     def get_agents_status(self):
         """
@@ -121,11 +143,11 @@ class AgentManager:
         """
         statuses = {}
         for name, agent in self.agents.items():
-            task_status = {task.name: "Completed" for task in agent.tasks}  # Simplified for example
+            task_status = {task_name: "Completed" for task_name in agent.tasks}  # Simplified for example
             statuses[name] = {
                 "status": "Active",
                 "tasks": task_status
             }
-        self.logger.info(f"Agent statuses: {statuses}")
+        self.logger.info("Agent statuses: %s", statuses)
         return statuses
 
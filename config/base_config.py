@@ -0,0 +1,24 @@
+from typing import Any, Mapping, Tuple
+from types import MappingProxyType
+
+class BaseConfig:
+    """Base for static configuration classes whose public attributes form the config"""
+    
+    _cached_config: Mapping[str, Any] = MappingProxyType({})
+
+    def __init_subclass__(
+        cls,
+        value_types: Tuple[type, ...] = (dict, str, int, float, bool, list),
+        **kwargs: Any
+    ) -> None:
+        super().__init_subclass__(**kwargs)
+        # Snapshot the public settings once, when the class body has been executed
+        cls._cached_config = MappingProxyType({
+            key: value for key, value in cls.__dict__.items()
+            if not key.startswith('_') and isinstance(value, value_types)
+        })
+
+    @classmethod
+    def get_config(cls) -> Mapping[str, Any]:
+        """Get all configuration as a read-only mapping"""
+        return cls._cached_config
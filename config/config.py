@@ -1,7 +1,7 @@
-from typing import Dict, Any
+from .base_config import BaseConfig
 from pathlib import Path
 
-class Config:
+class Config(BaseConfig, value_types=(dict, str, int, float, bool)):
     """Main configuration for ONIO AI Agent Framework"""
     
     # Base paths
@@ -61,11 +61,3 @@ class Config:
         "max_size": 10485760,  # 10MB
         "backup_count": 5
     }
-
-    @classmethod
-    def get_config(cls) -> Dict[str, Any]:
-        """Get all configuration as dictionary"""
-        return {
-            key: value for key, value in cls.__dict__.items()
-            if not key.startswith('_') and isinstance(value, (dict, str, int, float, bool))
-        } 
\ No newline at end of file
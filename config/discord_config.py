@@ -1,6 +1,6 @@
-from typing import Dict, Any
+from .base_config import BaseConfig
 
-class DiscordConfig:
+class DiscordConfig(BaseConfig):
     """Discord Bot Configuration for ONIO"""
     
     # Bot Configuration
@@ -58,11 +58,3 @@ class DiscordConfig:
         "use_embeds": True,
         "default_color": 0x3498db
     }
-
-    @classmethod
-    def get_config(cls) -> Dict[str, Any]:
-        """Get all Discord configuration as dictionary"""
-        return {
-            key: value for key, value in cls.__dict__.items()
-            if not key.startswith('_') and isinstance(value, (dict, str, int, float, bool, list))
-        } 
\ No newline at end of file
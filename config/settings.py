@@ -18,17 +18,22 @@ class Settings:
     
     def _load_env_vars(self):
         """Load configuration from environment variables"""
+        env = os.environ
+        
         # Override OpenAI API key if set in environment
-        if os.getenv('OPENAI_API_KEY'):
-            self.base_config.OPENAI_CONFIG['api_key'] = os.getenv('OPENAI_API_KEY')
+        openai_key = env.get('OPENAI_API_KEY')
+        if openai_key:
+            self.base_config.OPENAI_CONFIG['api_key'] = openai_key
             
         # Override Telegram token if set in environment
-        if os.getenv('TELEGRAM_BOT_TOKEN'):
-            self.telegram_config.BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
+        telegram_token = env.get('TELEGRAM_BOT_TOKEN')
+        if telegram_token:
+            self.telegram_config.BOT_TOKEN = telegram_token
             
         # Override Discord token if set in environment
-        if os.getenv('DISCORD_BOT_TOKEN'):
-            self.discord_config.BOT_TOKEN = os.getenv('DISCORD_BOT_TOKEN')
+        discord_token = env.get('DISCORD_BOT_TOKEN')
+        if discord_token:
+            self.discord_config.BOT_TOKEN = discord_token
     
     def get_all_config(self) -> Dict[str, Any]:
         """Get complete configuration"""
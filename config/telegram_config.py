@@ -1,6 +1,6 @@
-from typing import Dict, Any
+from .base_config import BaseConfig
 
-class TelegramConfig:
+class TelegramConfig(BaseConfig):
     """Telegram Bot Configuration for ONIO"""
     
     # Bot Configuration
@@ -52,11 +52,3 @@ class TelegramConfig:
         "allow_documents": True,
         "max_file_size": 20971520  # 20MB
     }
-
-    @classmethod
-    def get_config(cls) -> Dict[str, Any]:
-        """Get all Telegram configuration as dictionary"""
-        return {
-            key: value for key, value in cls.__dict__.items()
-            if not key.startswith('_') and isinstance(value, (dict, str, int, float, bool, list))
-        } 
\ No newline at end of file
@@ -1,7 +1,9 @@
 # task_base.py
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Deque, Dict, Any, Optional
 from datetime import datetime
+from collections import deque
 import logging
 from dataclasses import dataclass, field
 
@@ -15,6 +17,47 @@ class TaskResult:
     execution_time: float = 0.0
     timestamp: datetime = field(default_factory=datetime.now)
 
+class ResultWindow:
+    """Bounded window of recent TaskResults with running success and timing totals"""
+    
+    def __init__(self, maxlen: Optional[int]):
+        self.results: Deque[TaskResult] = deque(maxlen=maxlen)
+        self.success_count = 0
+        self.total_execution_time = 0.0
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def append(self, result: TaskResult) -> None:
+        """Add a result, evicting the oldest one (and its share of the totals) when full"""
+        results = self.results
+        if results.maxlen == 0:
+            return  # Window disabled; totals stay at zero
+        if len(results) == results.maxlen:
+            evicted = results[0]  # Dropped by the append below
+            self.success_count -= evicted.success
+            self.total_execution_time -= evicted.execution_time
+        
+        results.append(result)
+        self.success_count += result.success
+        self.total_execution_time += result.execution_time
+
+    def clear(self) -> None:
+        """Drop all results and reset the totals"""
+        self.results.clear()
+        self.success_count = 0
+        self.total_execution_time = 0.0
+
+    def success_rate(self) -> float:
+        """Fraction of results in the window that succeeded"""
+        count = len(self.results)
+        return self.success_count / count if count else 0
+
+    def average_execution_time(self) -> float:
+        """Mean execution time of the results in the window"""
+        count = len(self.results)
+        return self.total_execution_time / count if count else 0
+
 class TaskBase(ABC):
     """Base class for all tasks with enhanced functionality"""
     
@@ -22,7 +65,8 @@ class TaskBase(ABC):
         self.name = name
         self.config = config or {}
         self.logger = logging.getLogger(f"Task.{name}")
-        self.execution_history: List[TaskResult] = []
+        self._history = ResultWindow(self.config.get('history_size', 100))
+        self.execution_history: Deque[TaskResult] = self._history.results
         self.last_execution: Optional[TaskResult] = None
         self.retry_count = 0
         self.max_retries = self.config.get('max_retries', 3)
@@ -48,13 +92,14 @@ class TaskBase(ABC):
                 error=RuntimeError("Task already running")
             )
 
-        start_time = datetime.now()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()  # Monotonic; wall-clock time is only needed for result.timestamp
         self.is_running = True
         
         try:
             self.logger.info(f"Starting task: {self.name}")
             result = await self.execute()
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = loop.time() - start_time
             
             result.execution_time = execution_time
             result.timestamp = datetime.now()
@@ -70,7 +115,7 @@ class TaskBase(ABC):
                 success=False,
                 message=f"Task failed: {str(e)}",
                 error=e,
-                execution_time=(datetime.now() - start_time).total_seconds()
+                execution_time=loop.time() - start_time
             )
             self._update_history(result)
             
@@ -92,31 +137,25 @@ class TaskBase(ABC):
 
     async def _wait_before_retry(self) -> None:
         """Calculate and wait before retry with exponential backoff"""
-        import asyncio
         wait_time = min(300, 2 ** (self.retry_count - 1) * 5)  # Max 5 minutes
         self.logger.info(f"Waiting {wait_time}s before retry")
         await asyncio.sleep(wait_time)
 
     def _update_history(self, result: TaskResult) -> None:
-        """Update task execution history"""
+        """Update task execution history and its running aggregates"""
         self.last_execution = result
-        self.execution_history.append(result)
-        
-        # Keep only last 100 executions
-        if len(self.execution_history) > 100:
-            self.execution_history = self.execution_history[-100:]
+        self._history.append(result)
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get task execution metrics"""
-        successful_runs = len([r for r in self.execution_history if r.success])
-        total_runs = len(self.execution_history)
+        history = self._history
         
         return {
             'name': self.name,
-            'total_executions': total_runs,
-            'successful_executions': successful_runs,
-            'success_rate': successful_runs / total_runs if total_runs > 0 else 0,
-            'average_execution_time': sum(r.execution_time for r in self.execution_history) / total_runs if total_runs > 0 else 0,
+            'total_executions': len(history),
+            'successful_executions': history.success_count,
+            'success_rate': history.success_rate(),
+            'average_execution_time': history.average_execution_time(),
             'last_execution': self.last_execution.timestamp if self.last_execution else None,
             'is_running': self.is_running,
             'retry_count': self.retry_count
@@ -124,7 +163,7 @@ class TaskBase(ABC):
 
     def reset_metrics(self) -> None:
         """Reset task metrics and history"""
-        self.execution_history.clear()
+        self._history.clear()
         self.last_execution = None
         self.retry_count = 0
 
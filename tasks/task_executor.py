@@ -1,10 +1,22 @@
 # task_executor.py
-from task_base import Task
+import asyncio
+import logging
+from .task_base import TaskBase
+
+logger = logging.getLogger("TaskExecutor")
 
 class TaskExecutor:
     def __init__(self, agent):
         self.agent = agent
 
-    def execute_task(self, task):
-        print(f"Executing task {task.name} for agent {self.agent.name}")
-        task.run()
+    async def execute_task(self, task: TaskBase):
+        logger.info(f"Executing task {task.name} for agent {self.agent.agent_name}")
+        return await task.run()
+
+    async def execute_many(self, tasks):
+        """
+        Run several tasks concurrently.
+        :param tasks: Iterable of TaskBase instances.
+        :return: List of TaskResult objects (or exceptions) in the order given.
+        """
+        return await asyncio.gather(*(task.run() for task in tasks), return_exceptions=True)
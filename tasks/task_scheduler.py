@@ -1,21 +1,34 @@
 # task_scheduler.py
 import asyncio
-from typing import Dict, List, Optional, Any
+import heapq
+from typing import Deque, Dict, List, Optional, Any, Set, Tuple
 from datetime import datetime, timedelta
 import logging
-from collections import defaultdict
-from .task_base import TaskBase, TaskResult
+from .task_base import ResultWindow, TaskBase, TaskResult
 
 class TaskScheduler:
     """Advanced task scheduler with monitoring and management capabilities"""
     
-    def __init__(self):
+    def __init__(self, results_window: int = 100):
+        """
+        :param results_window: Number of most recent results kept per task; a task can
+            override it with a 'results_window' entry in its config
+        """
         self.logger = logging.getLogger("TaskScheduler")
         self.scheduled_tasks: Dict[str, Dict[str, Any]] = {}
         self.running_tasks: Dict[str, asyncio.Task] = {}
-        self.task_results: Dict[str, List[TaskResult]] = defaultdict(list)
+        self._results_window = results_window
+        # Per-task result windows; task_results exposes their deques
+        self._result_windows: Dict[str, ResultWindow] = {}
+        self.task_results: Dict[str, Deque[TaskResult]] = {}
         self.is_running = False
-        self._schedule_lock = asyncio.Lock()
+        # (loop time due, task name), earliest first; the loop sleeps until the head is due
+        self._due_heap: List[Tuple[float, str]] = []
+        # Due tasks held back by unmet dependencies, re-checked whenever a task finishes
+        self._waiting: Set[str] = set()
+        self._wakeup = asyncio.Event()
+        # Names of tasks that have completed, so dependency checks are set operations
+        self._completed: Set[str] = set()
         
     async def schedule_task(
         self,
@@ -34,29 +47,43 @@ class TaskScheduler:
         :param max_runs: Optional maximum number of executions
         :param dependencies: Optional list of task names that must complete before this task
         """
-        async with self._schedule_lock:
-            if task.name in self.scheduled_tasks:
-                raise ValueError(f"Task {task.name} is already scheduled")
-            
-            self.scheduled_tasks[task.name] = {
-                'task': task,
-                'interval': interval,
-                'last_run': None,
-                'next_run': datetime.now() + timedelta(seconds=start_delay or 0),
-                'runs_completed': 0,
-                'max_runs': max_runs,
-                'dependencies': dependencies or [],
-                'status': 'scheduled'
-            }
-            
-            self.logger.info(f"Scheduled task {task.name} with interval {interval}s")
-            
-            if self.is_running:
-                await self._start_task(task.name)
+        # No lock needed: nothing here awaits, so the check and insert can't interleave
+        if task.name in self.scheduled_tasks:
+            raise ValueError(f"Task {task.name} is already scheduled")
+        
+        self.scheduled_tasks[task.name] = {
+            'task': task,
+            'interval': interval,
+            'last_run': None,
+            'next_run': datetime.now() + timedelta(seconds=start_delay or 0),
+            'runs_completed': 0,
+            'max_runs': max_runs,
+            'dependencies': frozenset(dependencies or ()),
+            'status': 'scheduled'
+        }
+        
+        window = ResultWindow(task.config.get('results_window', self._results_window))
+        self._result_windows[task.name] = window
+        self.task_results[task.name] = window.results
+        
+        due = asyncio.get_running_loop().time() + (start_delay or 0)
+        heapq.heappush(self._due_heap, (due, task.name))
+        self._wakeup.set()
+        
+        self.logger.info(f"Scheduled task {task.name} with interval {interval}s")
 
     async def start(self) -> None:
         """Start the task scheduler"""
         self.is_running = True
+        
+        # Let task coroutines run inline until their first await (Python 3.12+),
+        # unless the application already installed its own task factory
+        loop = asyncio.get_running_loop()
+        eager_task_factory = getattr(asyncio, 'eager_task_factory', None)
+        installed_factory = eager_task_factory is not None and loop.get_task_factory() is None
+        if installed_factory:
+            loop.set_task_factory(eager_task_factory)
+        
         self.logger.info("Task scheduler started")
         
         try:
@@ -66,66 +93,80 @@ class TaskScheduler:
             raise
         finally:
             self.is_running = False
+            # Hand the loop back with its default factory so the host application isn't left eager
+            if installed_factory and loop.get_task_factory() is eager_task_factory:
+                loop.set_task_factory(None)
 
     async def stop(self) -> None:
         """Stop the task scheduler and all running tasks"""
         self.is_running = False
+        self._wakeup.set()
         self.logger.info("Stopping task scheduler...")
         
-        # Cancel all running tasks
-        for task_name, task in self.running_tasks.items():
-            self.logger.info(f"Cancelling task: {task_name}")
-            task.cancel()
+        # Snapshot first: finishing tasks remove themselves from running_tasks
+        tasks = list(self.running_tasks.values())
+        if tasks:
+            self.logger.info(f"Cancelling {len(tasks)} tasks: {list(self.running_tasks)}")
+            for task in tasks:
+                task.cancel()
             
-        # Wait for tasks to complete
-        if self.running_tasks:
-            await asyncio.gather(*self.running_tasks.values(), return_exceptions=True)
+            # Wait for tasks to complete
+            await asyncio.gather(*tasks, return_exceptions=True)
         
         self.running_tasks.clear()
         self.logger.info("Task scheduler stopped")
 
     async def _run_scheduler(self) -> None:
-        """Main scheduler loop"""
+        """Main scheduler loop: sleeps until the next task is due or something changes"""
+        loop = asyncio.get_running_loop()
         while self.is_running:
-            current_time = datetime.now()
+            self._wakeup.clear()
+            
+            # Move every due task into the waiting set
+            now = loop.time()
+            while self._due_heap and self._due_heap[0][0] <= now:
+                _, task_name = heapq.heappop(self._due_heap)
+                self._waiting.add(task_name)
             
-            # Check and start due tasks
-            for task_name, task_info in self.scheduled_tasks.items():
-                if task_info['status'] == 'scheduled' and current_time >= task_info['next_run']:
-                    if await self._can_run_task(task_name):
-                        await self._start_task(task_name)
+            # Start the waiting tasks whose dependencies are met
+            for task_name in list(self._waiting):
+                if self.scheduled_tasks[task_name]['status'] != 'scheduled':
+                    self._waiting.discard(task_name)
+                elif self._can_run_task(task_name):
+                    self._waiting.discard(task_name)
+                    await self._start_task(task_name)
             
-            await asyncio.sleep(1)  # Check every second
+            timeout = self._due_heap[0][0] - loop.time() if self._due_heap else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
 
-    async def _can_run_task(self, task_name: str) -> bool:
-        """Check if a task can run based on its dependencies"""
+    def _can_run_task(self, task_name: str) -> bool:
+        """Check if a task can run based on its dependencies and max runs"""
         task_info = self.scheduled_tasks[task_name]
         
-        # Check dependencies
-        for dep_name in task_info['dependencies']:
-            dep_info = self.scheduled_tasks.get(dep_name)
-            if not dep_info or dep_info['status'] != 'completed':
-                return False
-        
-        # Check max runs
-        if task_info['max_runs'] and task_info['runs_completed'] >= task_info['max_runs']:
+        dependencies = task_info['dependencies']
+        if dependencies and not dependencies <= self._completed:
             return False
-            
-        return True
+        
+        max_runs = task_info['max_runs']
+        return not max_runs or task_info['runs_completed'] < max_runs
 
     async def _start_task(self, task_name: str) -> None:
         """Start a task execution"""
         task_info = self.scheduled_tasks[task_name]
-        task = task_info['task']
+        
+        # Update task info first: with an eager task factory the run may finish inside create_task
+        now = datetime.now()
+        task_info['status'] = 'running'
+        task_info['last_run'] = now
+        task_info['next_run'] = now + timedelta(seconds=task_info['interval'])
         
         # Create and start task
         run_task = asyncio.create_task(self._run_task(task_name))
-        self.running_tasks[task_name] = run_task
-        
-        # Update task info
-        task_info['status'] = 'running'
-        task_info['last_run'] = datetime.now()
-        task_info['next_run'] = datetime.now() + timedelta(seconds=task_info['interval'])
+        if not run_task.done():
+            self.running_tasks[task_name] = run_task
 
     async def _run_task(self, task_name: str) -> None:
         """Execute a task and handle its completion"""
@@ -134,11 +175,12 @@ class TaskScheduler:
         
         try:
             result = await task.run()
-            self.task_results[task_name].append(result)
+            self._record_result(task_name, result)
             
             # Update task info
             task_info['runs_completed'] += 1
             task_info['status'] = 'completed'
+            self._completed.add(task_name)
             
             if result.success:
                 self.logger.info(f"Task {task_name} completed successfully")
@@ -151,6 +193,14 @@ class TaskScheduler:
         
         finally:
             self.running_tasks.pop(task_name, None)
+            self._wakeup.set()  # Dependents of this task may now be able to run
+
+    def _record_result(self, task_name: str, result: TaskResult) -> None:
+        """Append a result to the task's window, which keeps its aggregates in step"""
+        # Keep the exception but not its traceback, which pins every frame of the failed run
+        if result.error is not None:
+            result.error = result.error.with_traceback(None)
+        self._result_windows[task_name].append(result)
 
     def get_task_status(self, task_name: str) -> Dict[str, Any]:
         """Get detailed status of a task"""
@@ -158,7 +208,7 @@ class TaskScheduler:
             raise ValueError(f"Task {task_name} not found")
             
         task_info = self.scheduled_tasks[task_name]
-        results = self.task_results[task_name]
+        window = self._result_windows[task_name]
         
         return {
             'name': task_name,
@@ -166,9 +216,9 @@ class TaskScheduler:
             'last_run': task_info['last_run'],
             'next_run': task_info['next_run'],
             'runs_completed': task_info['runs_completed'],
-            'success_rate': len([r for r in results if r.success]) / len(results) if results else 0,
-            'average_execution_time': sum(r.execution_time for r in results) / len(results) if results else 0,
-            'dependencies': task_info['dependencies']
+            'success_rate': window.success_rate(),
+            'average_execution_time': window.average_execution_time(),
+            'dependencies': list(task_info['dependencies'])
         }
 
     def get_all_task_status(self) -> Dict[str, Dict[str, Any]]:
@@ -1,11 +1,38 @@
 # api_integration.py
-import requests
+import importlib.util
 import logging
-import time
-from requests.exceptions import RequestException, HTTPError, Timeout
+import httpx
+from tenacity import (
+    AsyncRetrying, before_sleep_log, retry_if_exception_type, retry_if_result,
+    stop_after_attempt, stop_after_delay, wait_exponential_jitter
+)
+from utils.json_utils import json_loads
+
+# HTTP/2 multiplexing needs the optional h2 package (pip install httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Failures worth retrying; anything else (including 4xx responses) is returned straight away
+_RETRYABLE_ERRORS = (httpx.TimeoutException, httpx.TransportError)
+
+def _is_server_error(response):
+    return 500 <= response.status_code < 600
+
+def _clamp_to_budget(wait, budget):
+    """
+    Wrap a tenacity wait so no sleep runs past `budget` seconds from the first attempt;
+    stop_after_delay then ends the retries once the budget is spent.
+    """
+    def clamped(retry_state):
+        remaining = budget - retry_state.seconds_since_start
+        return max(0.0, min(wait(retry_state), remaining))
+    return clamped
 
 class APIIntegration:
-    def __init__(self, base_url, api_key=None, headers=None, retries=3, timeout=10):
+    # Methods accepted by _make_request; dispatch goes straight through AsyncClient.request
+    _VERBS = frozenset(("GET", "POST", "PUT", "DELETE"))
+
+    def __init__(self, base_url, api_key=None, headers=None, retries=3, timeout=10,
+                 max_backoff=30, total_timeout=60):
         """
         Initialize the API integration with base URL, API key, headers, and retry policy.
         :param base_url: The base URL for the API.
@@ -13,12 +40,18 @@ class APIIntegration:
         :param headers: Additional headers for the requests (optional).
         :param retries: Number of retry attempts on failure (default is 3).
         :param timeout: Timeout for requests (default is 10 seconds).
+        :param max_backoff: Longest wait between retries in seconds (default is 30).
+        :param total_timeout: Seconds after the first attempt past which no retry is
+            started, or None for no limit (default is 60).
         """
         self.base_url = base_url
+        self._base = base_url.rstrip('/')
         self.api_key = api_key
         self.headers = headers or {}
         self.retries = retries
         self.timeout = timeout
+        self.max_backoff = max_backoff
+        self.total_timeout = total_timeout
         self.logger = logging.getLogger("APIIntegration")
         self.logger.setLevel(logging.DEBUG)
         
@@ -26,128 +59,154 @@ class APIIntegration:
         if self.api_key:
             self.headers["Authorization"] = f"Bearer {self.api_key}"
         
+        # One pooled client per integration keeps connections (and TLS sessions) alive across calls
+        self._client = httpx.AsyncClient(
+            headers=self.headers,
+            timeout=self.timeout,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
+        
         self.logger.info(f"Initialized APIIntegration with base URL: {self.base_url}")
 
-    def send_get_request(self, endpoint, params=None):
+    def _url(self, endpoint):
+        """
+        Build the full URL for an endpoint.
+        :param endpoint: API endpoint, with or without a leading slash.
+        :return: The full URL.
+        """
+        return f"{self._base}/{endpoint.lstrip('/')}"
+
+    async def aclose(self):
+        """
+        Close the underlying HTTP client and release its pooled connections.
+        """
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def send_get_request(self, endpoint, params=None):
         """
         Send a GET request to the specified endpoint with optional query parameters.
         :param endpoint: API endpoint to send the GET request to.
         :param params: Optional query parameters.
         :return: The response JSON data or None in case of failure.
         """
-        url = f"{self.base_url}/{endpoint}"
+        url = self._url(endpoint)
         try:
-            response = self._make_request("GET", url, params=params)
-            return response.json() if response else None
+            response = await self._make_request("GET", url, params=params)
+            return json_loads(response.content) if response is not None else None
         except Exception as e:
             self.logger.error(f"Error sending GET request to {url}: {str(e)}")
             return None
 
-    def send_post_request(self, endpoint, data=None):
+    async def send_post_request(self, endpoint, data=None):
         """
         Send a POST request to the specified endpoint with optional data.
         :param endpoint: API endpoint to send the POST request to.
         :param data: Optional data for the POST request (usually JSON format).
         :return: The response JSON data or None in case of failure.
         """
-        url = f"{self.base_url}/{endpoint}"
+        url = self._url(endpoint)
         try:
-            response = self._make_request("POST", url, json_data=data)
-            return response.json() if response else None
+            response = await self._make_request("POST", url, json_data=data)
+            return json_loads(response.content) if response is not None else None
         except Exception as e:
             self.logger.error(f"Error sending POST request to {url}: {str(e)}")
             return None
 
-    def send_put_request(self, endpoint, data=None):
+    async def send_put_request(self, endpoint, data=None):
         """
         Send a PUT request to the specified endpoint with optional data.
         :param endpoint: API endpoint to send the PUT request to.
         :param data: Optional data for the PUT request (usually JSON format).
         :return: The response JSON data or None in case of failure.
         """
-        url = f"{self.base_url}/{endpoint}"
+        url = self._url(endpoint)
         try:
-            response = self._make_request("PUT", url, json_data=data)
-            return response.json() if response else None
+            response = await self._make_request("PUT", url, json_data=data)
+            return json_loads(response.content) if response is not None else None
         except Exception as e:
             self.logger.error(f"Error sending PUT request to {url}: {str(e)}")
             return None
 
-    def send_delete_request(self, endpoint):
+    async def send_delete_request(self, endpoint):
         """
         Send a DELETE request to the specified endpoint.
         :param endpoint: API endpoint to send the DELETE request to.
         :return: The response JSON data or None in case of failure.
         """
-        url = f"{self.base_url}/{endpoint}"
+        url = self._url(endpoint)
         try:
-            response = self._make_request("DELETE", url)
-            return response.json() if response else None
+            response = await self._make_request("DELETE", url)
+            return json_loads(response.content) if response is not None else None
         except Exception as e:
             self.logger.error(f"Error sending DELETE request to {url}: {str(e)}")
             return None
 
-    def _make_request(self, method, url, params=None, json_data=None):
+    async def _make_request(self, method, url, params=None, json_data=None):
         """
         A helper method to make HTTP requests (GET, POST, PUT, DELETE).
-        Handles retries, timeout, and error logging.
+        Retries timeouts, transport errors and 5xx responses with jittered exponential
+        backoff (awaited, so the event loop keeps running) until the attempts or the
+        total_timeout budget run out; other errors and non-200 responses fail immediately.
         :param method: HTTP method (GET, POST, PUT, DELETE).
         :param url: The full URL to make the request to.
         :param params: Optional query parameters.
         :param json_data: Optional JSON data for POST/PUT requests.
-        :return: The HTTP response object.
-        """
-        attempts = 0
-        while attempts < self.retries:
-            try:
-                if method == "GET":
-                    response = requests.get(url, headers=self.headers, params=params, timeout=self.timeout)
-                elif method == "POST":
-                    response = requests.post(url, headers=self.headers, json=json_data, timeout=self.timeout)
-                elif method == "PUT":
-                    response = requests.put(url, headers=self.headers, json=json_data, timeout=self.timeout)
-                elif method == "DELETE":
-                    response = requests.delete(url, headers=self.headers, timeout=self.timeout)
-                else:
-                    self.logger.error(f"Unsupported HTTP method: {method}")
-                    return None
-                
-                # Check for successful response
-                if response.status_code == 200:
-                    return response
-                else:
-                    # Log HTTP errors (e.g., 4xx, 5xx)
-                    self.logger.error(f"HTTP error {response.status_code} - {response.text}")
-                    break
-            except Timeout:
-                self.logger.warning(f"Request timed out. Retrying... (Attempt {attempts + 1}/{self.retries})")
-            except HTTPError as e:
-                self.logger.error(f"HTTPError occurred: {e}")
-                break
-            except RequestException as e:
-                self.logger.error(f"RequestException occurred: {e}")
-                break
-            except Exception as e:
-                self.logger.error(f"An unexpected error occurred: {str(e)}")
-                break
-            
-            # Retry if the request fails
-            attempts += 1
-            time.sleep(2 ** attempts)  # Exponential backoff
+        :return: The HTTP response object, or None on failure.
+        """
+        if method not in self._VERBS:
+            self.logger.error(f"Unsupported HTTP method: {method}")
+            return None
         
+        stop = stop_after_attempt(self.retries)
+        wait = wait_exponential_jitter(initial=0.5, max=self.max_backoff)
+        if self.total_timeout is not None:
+            stop |= stop_after_delay(self.total_timeout)
+            wait = _clamp_to_budget(wait, self.total_timeout)
+        retrying = AsyncRetrying(
+            stop=stop,
+            wait=wait,
+            retry=retry_if_exception_type(_RETRYABLE_ERRORS) | retry_if_result(_is_server_error),
+            before_sleep=before_sleep_log(self.logger, logging.WARNING),
+            # Hand back the last response (or re-raise the last error) once attempts run out
+            retry_error_callback=lambda retry_state: retry_state.outcome.result()
+        )
+        try:
+            response = await retrying(self._client.request, method, url, params=params, json=json_data)
+        except httpx.TimeoutException:
+            self.logger.error(f"Request to {url} timed out after {self.retries} attempts")
+            return None
+        except httpx.RequestError as e:
+            self.logger.error(f"RequestException occurred: {e}")
+            return None
+        except Exception as e:
+            self.logger.error(f"An unexpected error occurred: {str(e)}")
+            return None
+        
+        # Check for successful response
+        if response.status_code == 200:
+            return response
+        # Log HTTP errors (e.g., 4xx, 5xx)
+        self.logger.error(f"HTTP error {response.status_code} - {response.text}")
         return None
 
-    def get_status_code(self, endpoint, params=None):
+    async def get_status_code(self, endpoint, params=None):
         """
         Get the HTTP status code for a GET request.
         :param endpoint: The endpoint to send the GET request to.
         :param params: Optional query parameters.
         :return: HTTP status code or None in case of failure.
         """
-        url = f"{self.base_url}/{endpoint}"
+        url = self._url(endpoint)
         try:
-            response = self._make_request("GET", url, params=params)
-            if response:
+            response = await self._make_request("GET", url, params=params)
+            if response is not None:
                 return response.status_code
         except Exception as e:
             self.logger.error(f"Error getting status code for {url}: {str(e)}")
@@ -166,13 +225,13 @@ class APIIntegration:
         else:
             self.logger.error(f"Unexpected Error ({status_code}): {error_message}")
 
-    def test_connection(self):
+    async def test_connection(self):
         """
         Test the connection to the API by sending a simple GET request to the root endpoint.
         :return: Boolean indicating whether the connection was successful.
         """
         try:
-            response = self.send_get_request("")
+            response = await self.send_get_request("")
             if response is not None:
                 self.logger.info("Connection to API was successful.")
                 return True
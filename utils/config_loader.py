@@ -1,14 +1,53 @@
 # config_loader.py
+import copy
+import functools
 import json
-import yaml
-import toml
 import logging
-from typing import Dict, Any, Optional, Union
+from typing import Any, Callable, ClassVar, Dict, Mapping, Optional, Tuple, Union
 from pathlib import Path
 from datetime import datetime
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
+@functools.lru_cache(maxsize=None)
+def _parser(format_type: str) -> Callable[[bytes], Dict[str, Any]]:
+    """
+    Return the fastest available parser for a format, importing it on first use
+    so only the formats actually loaded pay their import cost.
+    """
+    if format_type == 'json':
+        from utils.json_utils import json_loads
+        return json_loads
+    elif format_type == 'yaml':
+        import yaml
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)  # CSafeLoader needs libyaml
+        return lambda data: yaml.load(data, Loader=loader)
+    elif format_type == 'toml':
+        try:
+            import tomllib  # Python 3.11+
+            return lambda data: tomllib.loads(data.decode('utf-8'))
+        except ImportError:
+            import toml
+            return lambda data: toml.loads(data.decode('utf-8'))
+        
+    raise ValueError(f"Unsupported format type: {format_type}")
+
+def _load_by_format(file_path: Path, format_type: str) -> Dict[str, Any]:
+    """Load configuration based on file format"""
+    return _parser(format_type)(file_path.read_bytes())
+
+@functools.lru_cache(maxsize=32)
+def _parse(path_str: str, mtime_ns: int, size: int, format_type: str) -> Dict[str, Any]:
+    """
+    Parse a configuration file, cached by its stat signature so unchanged files
+    are parsed only once per process. Used for YAML only, where parsing is slower
+    than copying. The result is shared: copy before mutating.
+    """
+    return _load_by_format(Path(path_str), format_type)
+
 class ConfigLoader:
     """Configuration loader supporting multiple file formats (JSON, YAML, TOML)"""
     
@@ -19,6 +58,13 @@ class ConfigLoader:
         '.toml': 'toml'
     }
 
+    # (field, expected type) pairs checked by _validate_config
+    _REQUIRED: ClassVar[Tuple[Tuple[str, type], ...]] = (
+        ('agent_name', str),
+        ('environment', str),
+        ('logging', dict)
+    )
+
     def __init__(self, default_config: Optional[Dict[str, Any]] = None):
         """
         Initialize the config loader.
@@ -26,8 +72,10 @@ class ConfigLoader:
         """
         self.default_config = default_config or {}
         self._setup_logging()
-        self._last_loaded: Optional[datetime] = None
+        self._last_loaded_ns = 0  # st_mtime_ns of the last loaded file, 0 before the first load
         self._current_config: Dict[str, Any] = {}
+        # Read-only live view; load_config updates _current_config in place so it stays valid
+        self._config_view = MappingProxyType(self._current_config)
 
     def _setup_logging(self) -> None:
         """Setup logging configuration"""
@@ -49,8 +97,10 @@ class ConfigLoader:
         """
         file_path = Path(file_path)
         
-        if not file_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {file_path}")
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {file_path}") from None
 
         format_type = self.SUPPORTED_FORMATS.get(file_path.suffix.lower())
         if not format_type:
@@ -60,16 +110,23 @@ class ConfigLoader:
             )
 
         try:
-            config = self._load_by_format(file_path, format_type)
+            if format_type == 'yaml':
+                # YAML parsing costs far more than a deepcopy, so only YAML goes through the cache
+                config = copy.deepcopy(
+                    _parse(str(file_path.resolve()), stat.st_mtime_ns, stat.st_size, format_type)
+                )
+            else:
+                config = _load_by_format(file_path, format_type)
             
             if validate:
                 self._validate_config(config)
             
             # Merge with default config
-            merged_config = self._deep_merge(self.default_config.copy(), config)
+            merged_config = self._deep_merge(self.default_config, config)
             
-            self._current_config = merged_config
-            self._last_loaded = datetime.fromtimestamp(file_path.stat().st_mtime)
+            self._current_config.clear()
+            self._current_config.update(merged_config)
+            self._last_loaded_ns = stat.st_mtime_ns
             
             logger.info(f"Successfully loaded configuration from {file_path}")
             return merged_config
@@ -78,18 +135,6 @@ class ConfigLoader:
             logger.error(f"Error loading configuration from {file_path}: {str(e)}")
             raise
 
-    def _load_by_format(self, file_path: Path, format_type: str) -> Dict[str, Any]:
-        """Load configuration based on file format"""
-        with file_path.open('r', encoding='utf-8') as f:
-            if format_type == 'json':
-                return json.load(f)
-            elif format_type == 'yaml':
-                return yaml.safe_load(f)
-            elif format_type == 'toml':
-                return toml.load(f)
-            
-        raise ValueError(f"Unsupported format type: {format_type}")
-
     def save_config(self, config: Dict[str, Any], file_path: Union[str, Path], 
                    format_type: Optional[str] = None) -> None:
         """
@@ -117,8 +162,10 @@ class ConfigLoader:
                 if format_type == 'json':
                     json.dump(config, f, indent=4)
                 elif format_type == 'yaml':
+                    import yaml
                     yaml.safe_dump(config, f)
                 elif format_type == 'toml':
+                    import toml
                     toml.dump(config, f)
                     
             logger.info(f"Configuration saved to {file_path}")
@@ -133,38 +180,36 @@ class ConfigLoader:
 
     def _deep_merge(self, dict1: Dict[str, Any], dict2: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Recursively merge two dictionaries.
+        Merge dict2 over dict1 without mutating either. Only sub-dicts present in
+        both are copied; untouched subtrees of dict1 are shared with the result.
         :return: Merged dictionary
         """
-        for key, value in dict2.items():
-            if (
-                key in dict1 
-                and isinstance(dict1[key], dict) 
-                and isinstance(value, dict)
-            ):
-                dict1[key] = self._deep_merge(dict1[key], value)
-            else:
-                dict1[key] = value
-        return dict1
+        merged = dict1.copy()
+        stack = [(merged, dict2)]
+        while stack:
+            target, overrides = stack.pop()
+            for key, value in overrides.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    target[key] = current = current.copy()
+                    stack.append((current, value))
+                else:
+                    target[key] = value
+        return merged
 
     def _validate_config(self, config: Dict[str, Any]) -> None:
         """
         Validate configuration structure and required fields.
         Raise ValueError if validation fails.
         """
-        required_fields = {
-            'agent_name': str,
-            'environment': str,
-            'logging': dict
-        }
-
-        for field, expected_type in required_fields.items():
-            if field not in config:
+        for field, expected_type in self._REQUIRED:
+            value = config.get(field, _MISSING)
+            if value is _MISSING:
                 raise ValueError(f"Missing required field: {field}")
-            if not isinstance(config[field], expected_type):
+            if type(value) is not expected_type and not isinstance(value, expected_type):
                 raise ValueError(
                     f"Invalid type for {field}. Expected {expected_type.__name__}, "
-                    f"got {type(config[field]).__name__}"
+                    f"got {type(value).__name__}"
                 )
 
     def reload_if_modified(self, file_path: Union[str, Path]) -> bool:
@@ -172,17 +217,21 @@ class ConfigLoader:
         Check if config file has been modified and reload if necessary.
         :return: True if config was reloaded, False otherwise
         """
-        file_path = Path(file_path)
-        if not file_path.exists():
+        try:
+            mtime_ns = Path(file_path).stat().st_mtime_ns
+        except FileNotFoundError:
             return False
 
-        last_modified = datetime.fromtimestamp(file_path.stat().st_mtime)
-        if self._last_loaded and last_modified > self._last_loaded:
+        if self._last_loaded_ns and mtime_ns > self._last_loaded_ns:
             self.load_config(file_path)
             return True
         return False
 
     @property
-    def current_config(self) -> Dict[str, Any]:
-        """Get current configuration"""
-        return self._current_config.copy()
+    def current_config(self) -> Mapping[str, Any]:
+        """Get a read-only view of the current configuration"""
+        return self._config_view
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get an independent deep copy of the current configuration, safe to mutate"""
+        return copy.deepcopy(self._current_config)
@@ -0,0 +1,22 @@
+# json_utils.py
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+
+    def json_loads(data: Union[bytes, str]) -> Any:
+        """Parse JSON from bytes or str."""
+        return orjson.loads(data)
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize to indented JSON bytes with sorted keys."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    def json_loads(data: Union[bytes, str]) -> Any:
+        """Parse JSON from bytes or str."""
+        return json.loads(data)
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize to indented JSON bytes with sorted keys."""
+        return json.dumps(obj, indent=4, sort_keys=True).encode('utf-8')